@@ -1,11 +1,11 @@
 """TcEx Framework Module"""
 # standard library
-import base64
 import json
 import logging
 import os
-from collections.abc import Callable, Iterable
-from typing import Any
+from binascii import b2a_base64
+from collections.abc import Iterable
+from typing import Any, ClassVar
 
 # third-party
 from pydantic import BaseModel
@@ -14,6 +14,12 @@ from ...app.key_value_store import KeyValueRedis
 from ...app.key_value_store.key_value_store import KeyValueStore
 from ...util.util import Util
 
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # get logger
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 
@@ -21,6 +27,52 @@ _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 class PlaybookCreate:
     """Playbook Write ABC"""
 
+    __slots__ = (
+        '_batch_nesting',
+        '_batching',
+        '_by_key',
+        '_get_vmodel',
+        '_get_vtype',
+        '_is_pbvar',
+        '_log_debug',
+        '_null_validation_client_ok',
+        '_output_set',
+        '_pending',
+        '_var_type_cache',
+        '_write_null_enabled',
+        'context',
+        'key_value_store',
+        'log',
+        'output_variables',
+        'util',
+    )
+
+    # map variable type to its lower cased name, used to validate the type of a variable
+    _LOWER_TYPES: ClassVar[dict[str, str]] = {
+        'Binary': 'binary',
+        'BinaryArray': 'binaryarray',
+        'KeyValue': 'keyvalue',
+        'KeyValueArray': 'keyvaluearray',
+        'String': 'string',
+        'StringArray': 'stringarray',
+        'TCBatch': 'tcbatch',
+        'TCEntity': 'tcentity',
+        'TCEntityArray': 'tcentityarray',
+    }
+
+    # map variable type to create method
+    _TYPE_DISPATCH: ClassVar[dict[str, str]] = {
+        'binary': 'binary',
+        'binaryarray': 'binary_array',
+        'keyvalue': 'key_value',
+        'keyvaluearray': 'key_value_array',
+        'string': 'string',
+        'stringarray': 'string_array',
+        'tcentity': 'tc_entity',
+        'tcentityarray': 'tc_entity_array',
+        'tcbatch': 'tc_batch',
+    }
+
     def __init__(
         self,
         context: str,
@@ -36,16 +88,57 @@ class PlaybookCreate:
         self.log = _logger
         self.util = Util()
 
+        # pre-bound callables used on the write path
+        self._get_vmodel = self.util.get_playbook_variable_model
+        self._get_vtype = self.util.get_playbook_variable_type
+        self._is_pbvar = self.util.is_playbook_variable
+        self._log_debug = self.log.debug
+
+        # index requested output variables for constant time lookups
+        self._output_set = set(self.output_variables)
+        self._by_key: dict[tuple[str, str | None], str] = {}
+        for output_variable in self.output_variables:
+            variable_model = self._get_vmodel(output_variable)
+            if variable_model:
+                self._by_key.setdefault((variable_model.key, variable_model.type), output_variable)
+                # first match is used when the variable type is not provided
+                self._by_key.setdefault((variable_model.key, None), output_variable)
+
+        # null validation records can only be written to the Redis KV store
+        self._null_validation_client_ok = isinstance(self.key_value_store.client, KeyValueRedis)
+
+        # set by the tcex-test framework per profile to validate null outputs
+        self._write_null_enabled = os.getenv('TC_PLAYBOOK_WRITE_NULL') is not None
+
+        # lower cased variable type cache, the type of a variable never changes
+        self._var_type_cache: dict[str, str] = {}
+
+        # batched writes, flushed in a single round-trip
+        self._batching = False
+        self._pending: list[tuple[str, str, bytes | str]] = []
+
+        # per entered batch context, whether a batch was already open (nested/manual batch)
+        self._batch_nesting: list[bool] = []
+
+    def __enter__(self) -> 'PlaybookCreate':
+        """Start batching writes."""
+        self._batch_nesting.append(self._batching)
+        self.begin_batch()
+        return self
+
+    def __exit__(self, *args):
+        """Flush all batched writes, unless the batch was already open when entered."""
+        if self._batch_nesting.pop() is False:
+            self.flush_batch()
+
     @staticmethod
     def _check_iterable(value: dict | Iterable | str, validate: bool):
-        """Raise an exception if value is not an Iterable.
+        """Raise an exception if value is not an array.
 
         Validation:
-          - not a dict (dicts are iterable)
-          - not a string (strings are iterable)
-          - is Iterable
+          - is a list or tuple (concrete check, avoids the slower Iterable ABC check)
         """
-        if validate is True and (isinstance(value, dict | str) or not isinstance(value, Iterable)):
+        if validate is True and not isinstance(value, list | tuple):
             raise RuntimeError('Invalid data provided for KeyValueArray.')
 
     def _check_null(self, key: str, value: Any) -> bool:
@@ -60,27 +153,29 @@ class PlaybookCreate:
             invalid = True
 
             # specifically to allow the tcex-test framework to validate outputs
-            if os.getenv('TC_PLAYBOOK_WRITE_NULL') is not None and isinstance(
-                self.key_value_store.client, KeyValueRedis
-            ):
+            if key is not None and self._write_null_enabled and self._null_validation_client_ok:
                 variable = self._get_variable(key)
                 self.log.debug(f'event=writing-null-to-kvstore, variable={variable}')
-                self.key_value_store.redis_client.hset(
-                    self.context, f'{variable}_NULL_VALIDATION', ''
-                )
+                if self._batching is True:
+                    self._pending.append((self.context, f'{variable}_NULL_VALIDATION', ''))
+                else:
+                    self.key_value_store.redis_client.hset(
+                        self.context, f'{variable}_NULL_VALIDATION', ''
+                    )
 
         return invalid
 
     def _check_requested(self, variable: str, when_requested: bool) -> bool:
         """Return True if output variable was requested by downstream app."""
         if when_requested is True and not self.is_requested(variable):
-            self.log.debug(f'Variable {variable} was NOT requested by downstream app.')
+            if self.log.isEnabledFor(logging.DEBUG):
+                self._log_debug(f'Variable {variable} was NOT requested by downstream app.')
             return False
         return True
 
     def _check_variable_type(self, variable: str, type_: str):
         """Validate the correct type was passed to the method."""
-        if self.util.get_playbook_variable_type(variable).lower() != type_.lower():
+        if self._get_variable_type(variable) != self._LOWER_TYPES[type_]:
             raise RuntimeError(
                 f'Invalid variable provided ({variable}), variable must be of type {type_}.'
             )
@@ -100,14 +195,19 @@ class PlaybookCreate:
         return value
 
     def _create_data(self, key: str, value: bytes | str) -> int | None:
-        """Write data to key value store."""
-        self.log.debug(f'writing variable {key.strip()}')
-        try:
-            return self.key_value_store.client.create(self.context, key.strip(), value)
-        except RuntimeError as e:  # pragma: no cover
-            self.log.error(e)
+        """Write data to key value store.
+
+        When batching, the data is queued and None is returned. The data will
+        be written when the batch is flushed.
+        """
+        if self._batching is True:
+            if self.log.isEnabledFor(logging.DEBUG):
+                self._log_debug(f'queueing variable {key}')
+            self._pending.append((self.context, key, value))
             return None
 
+        return self._write_data(self.context, key, value)
+
     def _get_variable(self, key: str, variable_type: str | None = None) -> str | None:
         """Return properly formatted variable.
 
@@ -122,30 +222,69 @@ class PlaybookCreate:
         If no variable is found it means that the variable was not requested by the
         any downstream Apps or could possible be formatted incorrectly.
         """
-        if not self.util.is_playbook_variable(key):
-            # try to lookup the variable in the requested output variables.
-            for output_variable in self.output_variables:
-                variable_model = self.util.get_playbook_variable_model(output_variable)
-                if (
-                    variable_model
-                    and variable_model.key == key
-                    and (variable_type is None or variable_model.type == variable_type)
-                ):
-                    # either an exact match, or first match
-                    return output_variable
+        if not self._is_variable(key):
+            # lookup the variable in the requested output variables, either an exact match or
+            # first match. if not found the variable was not requested by downstream App or is
+            # misconfigured.
+            return self._by_key.get((key, variable_type))
+
+        # key was already a properly formatted variable
+        return key
+
+    def _get_variable_type(self, variable: str) -> str:
+        """Return the lower cased variable type for the provided variable."""
+        variable_type = self._var_type_cache.get(variable)
+        if variable_type is None:
+            variable_type = self._get_vtype(variable).lower()
+            self._var_type_cache[variable] = variable_type
+        return variable_type
+
+    def _is_variable(self, key: str) -> bool:
+        """Return True if key is a full variable (e.g., #App:1234:app.output!String)."""
+        # a full variable always starts with "#" and contains "!", only run the
+        # regex when that cheap check passes (e.g., not for plain keys like app.output)
+        return key.startswith('#') and '!' in key and self._is_pbvar(key)
+
+    def _nothing_requested(self, when_requested: bool) -> bool:
+        """Return True if no output variables were requested by downstream Apps.
+
+        When TC_PLAYBOOK_WRITE_NULL is set, null validation records still need to be written.
+        """
+        return when_requested is True and not self._output_set and not self._write_null_enabled
+
+    def _resolve_variable_verified(
+        self, key: str, variable_type: str, when_requested: bool
+    ) -> str | None:
+        """Return the requested variable for the key, ensuring it is of the provided type.
+
+        Variables resolved from the requested output variables are already of the correct
+        type and requested by a downstream App, so only a provided full variable (e.g.,
+        #App:1234:app.output!String) needs to be checked.
+        """
+        if not self._is_variable(key):
+            return self._by_key.get((key, variable_type))
 
-            # not requested by downstream App or misconfigured
+        if self._check_requested(key, when_requested) is False:
             return None
 
-        # key was already a properly formatted variable
+        # quick check to ensure an invalid type was not provided
+        self._check_variable_type(key, variable_type)
         return key
 
     @staticmethod
-    def _serialize_data(value: dict | list | str) -> str:
-        """Get the value from Redis if applicable."""
+    def _serialize_data(value: dict | list | str) -> bytes:
+        """Return the value serialized as JSON bytes, ready to be written to the KV store."""
+        if orjson is not None:
+            # orjson is significantly faster than json, use it when available
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                # orjson rejects some values json supports (e.g., integers over 64-bit)
+                pass
+
         try:
-            return json.dumps(value)
-        except ValueError as ex:  # pragma: no cover
+            return json.dumps(value).encode('utf-8')
+        except (TypeError, ValueError) as ex:  # pragma: no cover
             raise RuntimeError(f'Invalid data provided, failed to serialize value ({ex}).') from ex
 
     @staticmethod
@@ -167,16 +306,24 @@ class PlaybookCreate:
 
         return value
 
+    def _write_data(self, context: str, key: str, value: bytes | str) -> int | None:
+        """Write a single record to key value store."""
+        if self.log.isEnabledFor(logging.DEBUG):
+            self._log_debug(f'writing variable {key}')
+        try:
+            return self.key_value_store.client.create(context, key, value)
+        except RuntimeError as e:  # pragma: no cover
+            self.log.error(e)
+            return None
+
     @staticmethod
     def is_key_value(data: dict) -> bool:
         """Return True if provided data has proper structure for Key Value."""
-        if not isinstance(data, dict):
-            return False
-        return all(x in data for x in ['key', 'value'])
+        return isinstance(data, dict) and 'key' in data and 'value' in data
 
     def is_requested(self, variable: str) -> bool:
         """Return True if provided variable was requested by downstream App."""
-        return variable in self.output_variables
+        return variable in self._output_set
 
     @staticmethod
     def is_tc_batch(data: dict) -> bool:
@@ -192,9 +339,7 @@ class PlaybookCreate:
     @staticmethod
     def is_tc_entity(data: dict) -> bool:
         """Return True if provided data has proper structure for TC Entity."""
-        if not isinstance(data, dict):
-            return False
-        return all(x in data for x in ['id', 'value', 'type'])
+        return isinstance(data, dict) and 'id' in data and 'value' in data and 'type' in data
 
     def any(
         self,
@@ -223,6 +368,10 @@ class PlaybookCreate:
             variable_type: The variable type being written. Only required if not unique.
             when_requested: Only write the data if the variable was requested by downstream App.
         """
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
@@ -237,23 +386,63 @@ class PlaybookCreate:
             return None
 
         # get the type from the variable
-        variable_type = self.util.get_playbook_variable_type(variable).lower()
-
-        # map type to create method
-        variable_type_map: dict[str, Callable] = {
-            'binary': self.binary,
-            'binaryarray': self.binary_array,
-            'keyvalue': self.key_value,
-            'keyvaluearray': self.key_value_array,
-            'string': self.string,
-            'stringarray': self.string_array,
-            'tcentity': self.tc_entity,
-            'tcentityarray': self.tc_entity_array,
-            'tcbatch': self.tc_batch,
-        }
-        return variable_type_map.get(variable_type, self.raw)(  # type: ignore
-            variable, value, validate, when_requested  # type: ignore
-        )
+        variable_type = self._get_variable_type(variable)
+
+        # get the create method for the type, default to raw for custom types
+        method = getattr(self, self._TYPE_DISPATCH.get(variable_type, 'raw'))
+        return method(variable, value, validate, when_requested)
+
+    def any_many(
+        self,
+        items: list[tuple[str, Any]],
+        validate: bool = True,
+        when_requested: bool = True,
+    ) -> list[int | None]:
+        """Write multiple values to the keystore for all types in a single round-trip.
+
+        Each item is written using the any() method, with all writes sent to the KV store
+        together. When called inside of an open batch, the writes are queued with the rest
+        of the batch and None is returned for every item.
+
+        Args:
+            items: The (key, value) pairs to write to the DB (e.g., [('app.colors', ['red'])]).
+            validate: Perform validation on the data.
+            when_requested: Only write the data if the variable was requested by downstream App.
+        """
+        in_batch = self._batching
+        self.begin_batch()
+
+        # the position of each item's write in the pending queue
+        positions: list[int | None] = []
+        try:
+            for key, value in items:
+                pending_count = len(self._pending)
+                self.any(key, value, validate=validate, when_requested=when_requested)
+
+                # null values only queue null validation records, not data
+                if value is not None and len(self._pending) > pending_count:
+                    positions.append(len(self._pending) - 1)
+                else:
+                    positions.append(None)
+        finally:
+            results = [] if in_batch else self.flush_batch()
+
+        if in_batch:
+            return [None] * len(positions)
+        return [None if p is None else results[p] for p in positions]
+
+    def batch(self) -> 'PlaybookCreate':
+        """Return a context manager that batches all writes into a single round-trip.
+
+        with playbook.create.batch():
+            playbook.create.string('app.one', 'one')
+            playbook.create.binary('app.two', b'two')
+        """
+        return self
+
+    def begin_batch(self):
+        """Start queueing writes until flush_batch is called."""
+        self._batching = True
 
     def binary(
         self,
@@ -263,30 +452,26 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'Binary')
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'Binary', when_requested)
         if variable is None:
             # variable is invalid or not requested by downstream App
             return None
 
-        if self._check_requested(variable, when_requested) is False:
-            # variable is not requested by downstream App
-            return None
-
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'Binary')
-
         # basic validation of value
         if validate and not isinstance(value, bytes):
             raise RuntimeError('Invalid data provided for Binary.')
 
-        # prepare value - playbook Binary fields are base64 encoded
-        value_ = base64.b64encode(value).decode('utf-8')
-        value_ = self._serialize_data(value_)
-        return self._create_data(variable, value_)
+        # prepare value - playbook Binary fields are base64 encoded and serialized as a JSON
+        # string, base64 output never requires JSON escaping.
+        return self._create_data(variable, b'"' + b2a_base64(value, newline=False) + b'"')
 
     def binary_array(
         self,
@@ -296,32 +481,53 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
         # validate array type provided
         self._check_iterable(value, validate)
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'BinaryArray')
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'BinaryArray', when_requested)
         if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        if self._check_requested(variable, when_requested) is False:
-            return None
+        # basic validation of value
+        if validate and not all(v is None or isinstance(v, bytes) for v in value):
+            raise RuntimeError('Invalid data provided for Binary.')
 
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'BinaryArray')
+        # prepare value - playbook Binary fields are base64 encoded. the JSON array is built
+        # directly in a single pass, base64 output never requires JSON escaping.
+        value_serialized = b','.join(
+            [b'null' if v is None else b'"' + b2a_base64(v, newline=False) + b'"' for v in value]
+        )
+        return self._create_data(variable, b'[' + value_serialized + b']')
 
-        # basic validation and prep of value
-        value_encoded = []
-        for v in value:
-            if v is not None:
-                if validate and not isinstance(v, bytes):
-                    raise RuntimeError('Invalid data provided for Binary.')
-                v = base64.b64encode(v).decode('utf-8')
-            value_encoded.append(v)
-        return self._create_data(variable, self._serialize_data(value_encoded))
+    def flush_batch(self) -> list[int | None]:
+        """Write all queued data to key value store and stop batching.
+
+        For the Redis KV store the queued data is sent using a single pipeline,
+        other KV stores fall back to writing each record individually.
+        """
+        pending = self._pending
+        self._batching = False
+        self._pending = []
+        if not pending:
+            return []
+
+        if not isinstance(self.key_value_store.client, KeyValueRedis):
+            return [self._write_data(context, key, value) for context, key, value in pending]
+
+        self.log.debug(f'writing {len(pending)} batched variables')
+        pipe = self.key_value_store.redis_client.pipeline(transaction=False)
+        for context, key, value in pending:
+            pipe.hset(context, key, value)
+        return pipe.execute()
 
     def key_value(
         self,
@@ -331,20 +537,19 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
-        if self._check_null(key, value) is True:
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
             return None
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'KeyValue')
-        if variable is None:
+        if self._check_null(key, value) is True:
             return None
 
-        if self._check_requested(variable, when_requested) is False:
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'KeyValue', when_requested)
+        if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'KeyValue')
-
         # basic validation and prep of value
         value = self._process_object_types(value, validate)
         if validate and not self.is_key_value(value):
@@ -360,33 +565,34 @@ class PlaybookCreate:
         when_requested: bool = True,
     ):
         """Create the value in Redis if applicable."""
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
         # validate array type provided
         self._check_iterable(value, validate)
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'KeyValueArray')
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'KeyValueArray', when_requested)
         if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        if self._check_requested(variable, when_requested) is False:
-            return None
-
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'KeyValueArray')
+        # prep of value, plain dicts are the common case and need no conversion
+        process_object_types = self._process_object_types
+        values: list[dict] = [
+            v if isinstance(v, dict) else process_object_types(v, validate, allow_none=True)
+            for v in value
+        ]
 
-        # basic validation and prep of value
-        _value = []
-        for v in value:
-            v = self._process_object_types(v, validate, allow_none=True)
-            if validate and not self.is_key_value(v):
-                raise RuntimeError('Invalid data provided for KeyValueArray.')
-            _value.append(v)
-        value = _value
+        # basic validation of value
+        if validate and not all(self.is_key_value(v) for v in values):
+            raise RuntimeError('Invalid data provided for KeyValueArray.')
 
-        return self._create_data(variable, self._serialize_data(value))
+        return self._create_data(variable, self._serialize_data(values))
 
     def string(
         self,
@@ -396,20 +602,19 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
-        if self._check_null(key, value) is True:
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
             return None
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'String')
-        if variable is None:
+        if self._check_null(key, value) is True:
             return None
 
-        if self._check_requested(variable, when_requested) is False:
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'String', when_requested)
+        if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'String')
-
         # coerce string values
         value = self._coerce_string_value(value)
 
@@ -427,34 +632,29 @@ class PlaybookCreate:
         when_requested: bool = True,
     ):
         """Create the value in Redis if applicable."""
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
         # validate array type provided
         self._check_iterable(value, validate)
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'StringArray')
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'StringArray', when_requested)
         if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        if self._check_requested(variable, when_requested) is False:
-            return None
-
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'StringArray')
-
-        # basic validation and prep of value
-        value_coerced = []
-        for v in value:
-            # coerce string values
-            v = self._coerce_string_value(v)
+        # coerce string values, str is the common case and needs no coercion
+        coerce = self._coerce_string_value
+        value = [v if isinstance(v, str) else coerce(v) for v in value]
 
-            # validation only needs to check str because value was coerced
-            if validate and not isinstance(v, type(None) | str):
-                raise RuntimeError('Invalid data provided for StringArray.')
-            value_coerced.append(v)
-        value = value_coerced
+        # validation only needs to check str because values were coerced
+        if validate and not all(v is None or isinstance(v, str) for v in value):
+            raise RuntimeError('Invalid data provided for StringArray.')
 
         return self._create_data(variable, self._serialize_data(value))
 
@@ -474,7 +674,8 @@ class PlaybookCreate:
         if self._check_null(key, value):
             return None
 
-        return self._create_data(key, value)
+        # the key is user provided, variables from the other methods are already clean
+        return self._create_data(key.strip(), value)
 
     def tc_batch(
         self,
@@ -484,20 +685,19 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
-        if self._check_null(key, value) is True:
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
             return None
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'TCBatch')
-        if variable is None:
+        if self._check_null(key, value) is True:
             return None
 
-        if self._check_requested(variable, when_requested) is False:
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'TCBatch', when_requested)
+        if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'TCBatch')
-
         # basic validation
         value = self._process_object_types(value, validate)
         if validate and not self.is_tc_batch(value):
@@ -513,20 +713,19 @@ class PlaybookCreate:
         when_requested: bool = True,
     ) -> int | None:
         """Create the value in Redis if applicable."""
-        if self._check_null(key, value) is True:
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
             return None
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'TCEntity')
-        if variable is None:
+        if self._check_null(key, value) is True:
             return None
 
-        if self._check_requested(variable, when_requested) is False:
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'TCEntity', when_requested)
+        if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'TCEntity')
-
         # basic validation
         value = self._process_object_types(value, validate)
         if validate and not self.is_tc_entity(value):
@@ -542,33 +741,34 @@ class PlaybookCreate:
         when_requested: bool = True,
     ):
         """Create the value in Redis if applicable."""
+        # short-circuit the process, if there are no downstream variables requested.
+        if self._nothing_requested(when_requested) is True:
+            return None
+
         if self._check_null(key, value) is True:
             return None
 
         # validate array type provided
         self._check_iterable(value, validate)
 
-        # convert key to variable if required
-        variable = self._get_variable(key, 'TCEntityArray')
+        # convert key to variable if required, validating the type of provided variables
+        variable = self._resolve_variable_verified(key, 'TCEntityArray', when_requested)
         if variable is None:
+            # variable is invalid or not requested by downstream App
             return None
 
-        if self._check_requested(variable, when_requested) is False:
-            return None
-
-        # quick check to ensure an invalid type was not provided
-        self._check_variable_type(variable, 'TCEntityArray')
+        # prep of value, plain dicts are the common case and need no conversion
+        process_object_types = self._process_object_types
+        values: list[dict] = [
+            v if isinstance(v, dict) else process_object_types(v, validate, allow_none=True)
+            for v in value
+        ]
 
-        # basic validation and prep of value
-        _value = []
-        for v in value:
-            v = self._process_object_types(v, validate, allow_none=True)
-            if validate and not self.is_tc_entity(v):
-                raise RuntimeError('Invalid data provided for TcEntityArray.')
-            _value.append(v)
-        value = _value
+        # basic validation of value
+        if validate and not all(self.is_tc_entity(v) for v in values):
+            raise RuntimeError('Invalid data provided for TcEntityArray.')
 
-        return self._create_data(variable, self._serialize_data(value))
+        return self._create_data(variable, self._serialize_data(values))
 
     def variable(
         self,
@@ -601,7 +801,8 @@ class PlaybookCreate:
 
         # short-circuit the process, if there are no downstream variables requested.
         if not self.output_variables:  # pragma: no cover
-            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
+            if self.log.isEnabledFor(logging.DEBUG):
+                self._log_debug(f'Variable {key} was NOT requested by downstream app.')
             return None
 
         # key can be provided as the variable key (e.g., app.output) or
@@ -611,8 +812,9 @@ class PlaybookCreate:
         if variable is None:
             return None
 
-        if variable is None or variable not in self.output_variables:
-            self.log.debug(f'Variable {key} was NOT requested by downstream app.')
+        if variable is None or not self.is_requested(variable):
+            if self.log.isEnabledFor(logging.DEBUG):
+                self._log_debug(f'Variable {key} was NOT requested by downstream app.')
             return None
 
         # write the variable (None value would be caught in _check_null method)
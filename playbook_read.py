@@ -4,18 +4,73 @@ import base64
 import json
 import logging
 import re
-from collections import OrderedDict
-from typing import Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, ClassVar, cast
 
+from ...app.key_value_store import KeyValueRedis
 from ...app.key_value_store.key_value_store import KeyValueStore
 from ...input.field_type.sensitive import Sensitive
 from ...registry import registry
 from ...util.util import Util
 from ...util.variable import BinaryVariable, StringVariable
 
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # get logger
 _logger = logging.getLogger(__name__.split('.', maxsplit=1)[0])
 
+# compiled user input space pattern (see _process_space_patterns)
+_RE_SPACE = re.compile(r'(\\\\s)|\\s')
+
+# string coercion for bool, float and int values, keyed by exact type
+_COERCERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: 'true' if v else 'false',
+    float: str,
+    int: str,
+}
+
+# shared Util instance for the cached variable helpers
+_util = Util()
+
+# compiled variable patterns
+_RE_VARIABLE_EXPANSION = re.compile(_util.variable_expansion_pattern)
+_RE_VARIABLE_PLAYBOOK_MATCH = re.compile(_util.variable_playbook_match)
+
+
+def _json_loads(value: bytes | str) -> Any:
+    """Return the loaded JSON value, using orjson when available (both accept bytes or str).
+
+    json is used when orjson rejects the data (e.g., NaN/Infinity). Note: orjson loads
+    integers outside the 64-bit range as a float.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(value)
+
+
+@lru_cache(maxsize=1024)
+def _get_variable_type(variable: str) -> str:
+    """Return the lower cased variable type, cached as the type of a variable never changes."""
+    return _util.get_playbook_variable_type(variable).lower()
+
+
+def _is_playbook_variable(value: Any) -> bool:
+    """Return True if value is a playbook variable.
+
+    The values are user data (not keys) so the result is not cached, a playbook
+    variable always starts with "#" so the pattern match is skipped for most values.
+    """
+    return isinstance(value, str) and value.startswith('#') and _util.is_playbook_variable(value)
+
 
 class PlaybookRead:
     """Playbook Read
@@ -28,6 +83,41 @@ class PlaybookRead:
             startup, but for service Apps each request gets different outputs.
     """
 
+    __slots__ = (
+        '_prefetched',
+        'context',
+        'key_value_store',
+        'log',
+        'util',
+    )
+
+    # map variable type to its lower cased name, used to validate the type of a variable
+    _LOWER_TYPES: ClassVar[dict[str, str]] = {
+        'Binary': 'binary',
+        'BinaryArray': 'binaryarray',
+        'KeyValue': 'keyvalue',
+        'KeyValueArray': 'keyvaluearray',
+        'String': 'string',
+        'StringArray': 'stringarray',
+        'TCBatch': 'tcbatch',
+        'TCEntity': 'tcentity',
+        'TCEntityArray': 'tcentityarray',
+    }
+
+    # map variable type to (read method, variable wrapper, is array)
+    _ANY_DISPATCH: ClassVar[dict[str, tuple[str, type | None, bool]]] = {
+        'binary': ('binary', BinaryVariable, False),
+        'binaryarray': ('binary_array', BinaryVariable, True),
+        'keyvalue': ('key_value', None, False),
+        'keyvaluearray': ('key_value_array', None, False),
+        'string': ('string', StringVariable, False),
+        'stringarray': ('string_array', StringVariable, True),
+        'tcbatch': ('tc_batch', None, False),
+        'tcentity': ('tc_entity', None, False),
+        'tcentityarray': ('tc_entity_array', None, False),
+        # 'tcenhancedentity': ('tc_entity', None, False),
+    }
+
     def __init__(self, context: str, key_value_store: KeyValueStore):
         """Initialize the class properties."""
         self.context = context
@@ -35,32 +125,25 @@ class PlaybookRead:
 
         # properties
         self.log = _logger
-        self.util = Util()
+        self.util = _util
 
-    def _check_variable_type(self, variable: str, type_: str):
-        """Validate the correct type was passed to the method."""
-        if self.util.get_playbook_variable_type(variable).lower() != type_.lower():
-            raise RuntimeError(
-                f'Invalid variable provided ({variable}), variable must be of type {type_}.'
-            )
+        # data retrieved in bulk by any_many, keyed by variable
+        self._prefetched: dict[str, bytes | str | None] = {}
 
     @staticmethod
     def _coerce_string_value(value: bool | float | int | str | Sensitive) -> str | Sensitive:
         """Return a string value from an bool or int."""
-        # coerce bool before int as python says a bool is an int
-        if isinstance(value, bool):
-            # coerce bool to str type
-            value = str(value).lower()
-
-        # coerce int to str type
-        if isinstance(value, float | int):
-            value = str(value)
-
-        return value
+        # exact type lookup, bool is its own key so it is not coerced as an int
+        coerce = _COERCERS.get(type(value))
+        return cast(str | Sensitive, value) if coerce is None else coerce(value)
 
     @staticmethod
     def _decode_binary(data: bytes) -> str:
         """Return decoded bytes data handling data written by java apps."""
+        # ascii is the common case and the fastest decode path
+        if data.isascii():
+            return data.decode('ascii')
+
         try:
             _data = data.decode('utf-8')
         except UnicodeDecodeError:  # pragma: no cover
@@ -70,25 +153,48 @@ class PlaybookRead:
 
     @staticmethod
     def _deserialize_data(value: bytes | str) -> Any:
-        """Return the loaded JSON value or raise an error."""
+        """Return the loaded JSON value or raise an error.
+
+        Bytes are loaded directly, there is no need to decode the data to a string first.
+        """
         try:
-            return json.loads(value, object_pairs_hook=OrderedDict)
+            return _json_loads(value)
         except ValueError as ex:  # pragma: no cover
             raise RuntimeError(f'Failed to JSON load data "{value}" ({ex}).') from ex
 
     def _get_data(self, key: str) -> bytes | str | None:
-        """Get the value from Redis if applicable."""
+        """Get the value from Redis if applicable.
+
+        The key must already be stripped by the calling method.
+        """
+        if self._prefetched and key in self._prefetched:
+            return self._prefetched[key]
+
         try:
-            return self.key_value_store.client.read(self.context, key.strip())
+            return self.key_value_store.client.read(self.context, key)
         except RuntimeError as ex:
             self.log.error(ex)
         return None
 
+    def _get_data_many(self, keys: list[str]) -> list[bytes | str | None]:
+        """Get the values for multiple keys from Redis in a single round-trip if applicable.
+
+        For the Redis KV store a single pipeline is used, other KV stores fall back
+        to reading each key individually. The keys must already be stripped.
+        """
+        if not isinstance(self.key_value_store.client, KeyValueRedis):
+            return [self._get_data(key) for key in keys]
+
+        pipe = self.key_value_store.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hget(self.context, key)
+        return pipe.execute()
+
     @staticmethod
     def _load_data(value: str) -> dict | list[dict | str] | str:
         """Return the loaded JSON value or raise an error."""
         try:
-            return json.loads(value, object_pairs_hook=OrderedDict)
+            return _json_loads(value)
         except ValueError as ex:  # pragma: no cover
             raise RuntimeError(f'Failed to JSON load data "{value}" ({ex}).') from ex
 
@@ -100,6 +206,22 @@ class PlaybookRead:
 
         return False
 
+    def _prepare_key(self, key: str | None, type_: str) -> str | None:
+        """Return the stripped key after validating the correct type was passed to the method.
+
+        None is returned (with a warning) when the provided key is None.
+        """
+        if key is None:
+            self.log.warning('The provided key was None.')
+            return None
+
+        key = key.strip()
+        if _get_variable_type(key) != self._LOWER_TYPES[type_]:
+            raise RuntimeError(
+                f'Invalid variable provided ({key}), variable must be of type {type_}.'
+            )
+        return key
+
     def _process_key_value(self, data: dict, resolve_embedded: bool) -> dict | None:
         """Read the value from key value store.
 
@@ -143,7 +265,7 @@ class PlaybookRead:
         # check if keyvalue value is a variable
         if resolve_embedded:
             value = data['value']
-            if self.util.is_playbook_variable(value):
+            if _is_playbook_variable(value):
                 # any type can be nested, but no further nesting is supported
                 data['value'] = self.any(value)
             else:
@@ -157,9 +279,11 @@ class PlaybookRead:
         r"""Return the string with \s replace with spaces."""
         # replace "\s" with a space only for user input.
         # using '\\s' will prevent replacement.
-        string = re.sub(r'(?<!\\)\\s', ' ', string)
-        string = re.sub(r'\\\\s', r'\\s', string)
-        return string
+        if '\\s' not in string:
+            return string
+
+        # single pass, an escaped "\\s" is matched first and unescaped to "\s"
+        return _RE_SPACE.sub(lambda m: r'\s' if m.group(1) else ' ', string)
 
     def _read_embedded(self, value: str) -> Sensitive | str:
         r"""Read method for "embedded" variables.
@@ -210,60 +334,73 @@ class PlaybookRead:
         Returns:
             (str): Results retrieved from DB
         """
-        if value is None:  # pragma: no cover
+        # only strings can have embedded variables, and every variable starts with "#" or "&"
+        if not isinstance(value, str) or ('#' not in value and '&' not in value):
             return value
 
-        value_ = value
-        for match in re.finditer(self.util.variable_expansion_pattern, str(value)):
-            variable = match.group(0)  # the full variable pattern
-            v = None
-            if match.group('origin') == '#':  # pb-variable
-                v = self.any(variable)
-            elif match.group('origin') == '&':  # tc-variable
-                v = registry.inputs.resolve_variable(variable)
+        match = _RE_VARIABLE_EXPANSION.match(value)
+        if match is not None and match.end() == len(value):
+            v = self._resolve_embedded_variable(match)
+            if isinstance(v, Sensitive):
+                # handle when tc variables are embedded in a a playbook variable and the
+                # type is KeyChain. a Sensitive value needs to be returned so that the
+                # developer can control the output of the data, protecting the value.
+                # this is done when the variable is an exact match to the value.
+                return v
+            return str(v) if isinstance(v, str) else value
 
-            # TODO: [high] should this behavior be changed in 3.0?
+        def _replace(match: re.Match) -> str:
+            """Return the replacement for a single embedded variable."""
+            v = self._resolve_embedded_variable(match)
+            if isinstance(v, Sensitive):
+                # alternate to above this handles when tc variables is embedded in a string.
+                # this is NOT recommended, but still supported through this method.
+                return v.value
+            return v if isinstance(v, str) else match.group(0)
+
+        # all variables are replaced in a single pass. a replacement function is used since
+        # a replacement string would have escaped characters like \t processed by re.sub.
+        return _RE_VARIABLE_EXPANSION.sub(_replace, value)
+
+    def _resolve_embedded_variable(self, match: re.Match) -> Any:
+        """Return the value of an embedded variable match, formatted for embedding."""
+        variable = match.group(0)  # the full variable pattern
+        v = None
+        if match.group('origin') == '#':  # pb-variable
+            v = self.any(variable)
+        elif match.group('origin') == '&':  # tc-variable
+            v = registry.inputs.resolve_variable(variable)
+
+        # TODO: [high] should this behavior be changed in 3.0?
+        debug_enabled = self.log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
             self.log.debug(f'embedded variable: {variable}, value: {v}')
 
-            if match.group('type') in ['Binary', 'BinaryArray']:
+        if match.group('type') in ['Binary', 'BinaryArray']:
+            if debug_enabled:
                 self.log.debug(
                     f'Binary types may not be embedded into strings. Could not embed: {variable}'
                 )
-                v = '<binary>'
+            v = '<binary>'
 
-            if isinstance(v, dict | list):
-                v = json.dumps(v)
-            elif v is None:
-                v = '<null>'
+        if isinstance(v, dict | list):
+            v = json.dumps(v)
+        elif v is None:
+            v = '<null>'
 
-            # value.replace was chosen over re.sub due to an issue encountered while testing an app.
-            # re.sub will handle escaped characters like \t, value.replace would not handle these
-            # scenarios.
-            if isinstance(v, Sensitive) and value_ == variable:
-                # handle when tc variables are embedded in a a playbook variable and the
-                # type is KeyChain. a Sensitive value needs to be returned so that the
-                # developer can control the output of the data, protecting the value.
-                # this is done when the variable is an exact match to the value.
-                value_ = v
-            elif isinstance(value_, str) and isinstance(v, Sensitive):
-                # alternate to above this handles when tc variables is embedded in a string.
-                # this is NOT recommended, but still supported through this method.
-                value_ = value_.replace(variable, v.value)
-            elif isinstance(value_, str) and isinstance(v, str):
-                value_ = value_.replace(variable, v)
-
-        return value_
+        return v
 
     @staticmethod
     def _to_array(value: list | str | None) -> list:
         """Return the provided array as a list."""
+        if isinstance(value, list):
+            # the common case, return the list as-is
+            return value
         if value is None:
             # Adding none value to list breaks App logic. It's better to not request
             # Array and build array externally if None values are required.
-            value = []
-        elif not isinstance(value, list):
-            value = [value]
-        return value
+            return []
+        return [value]
 
     def any(self, key: str) -> bytes | dict | list | str | None:
         """Return the value from the keystore for all types.
@@ -275,36 +412,34 @@ class PlaybookRead:
             return None
 
         key = key.strip()  # clean up key
-        variable_type = self.util.get_playbook_variable_type(key).lower()
-        variable_type_map = {
-            'binary': self.binary,
-            'binaryarray': self.binary_array,
-            'keyvalue': self.key_value,
-            'keyvaluearray': self.key_value_array,
-            'string': self.string,
-            'stringarray': self.string_array,
-            'tcbatch': self.tc_batch,
-            'tcentity': self.tc_entity,
-            'tcentityarray': self.tc_entity_array,
-            # 'tcenhancedentity': self.tc_entity,
-        }
-        value = variable_type_map.get(variable_type, self.raw)(key)
-
-        if value is not None:
-            if variable_type == 'binary':
-                value = BinaryVariable(value)
-            elif variable_type == 'binaryarray':
-                value = [v if v is None else BinaryVariable(v) for v in value]
-            elif variable_type == 'string':
-                value = StringVariable(value)
-            elif variable_type == 'stringarray':
-                value = [v if v is None else StringVariable(v) for v in value]
+        variable_type = _get_variable_type(key)
+        method, wrapper, is_array = self._ANY_DISPATCH.get(variable_type, ('raw', None, False))
+        value = getattr(self, method)(key)
+
+        if value is not None and wrapper is not None:
+            if is_array is True:
+                value = [v if v is None else wrapper(v) for v in value]
+            else:
+                value = wrapper(value)
 
         return value
 
+    def any_many(self, keys: list[str]) -> list[bytes | dict | list | str | None]:
+        """Return the values from the keystore for multiple variables of all types.
+
+        The data for all variables is retrieved in a single round-trip, then each value is
+        processed the same as the any() method. Values are returned in the order of the keys.
+        """
+        keys_ = [key.strip() for key in keys if key is not None]
+        self._prefetched = dict(zip(keys_, self._get_data_many(keys_)))
+        try:
+            return [self.any(key) for key in keys]
+        finally:
+            self._prefetched = {}
+
     def binary(
         self,
-        key: str,
+        key: str | None,
         b64decode: bool = True,
         decode: bool = False,
     ) -> BinaryVariable | str | None:
@@ -316,12 +451,11 @@ class PlaybookRead:
         This method will deserialize the string, then OPTIONALLY base64 decode the data, and
         finally return the Binary data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'Binary')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'Binary')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
@@ -353,7 +487,7 @@ class PlaybookRead:
 
     def binary_array(
         self,
-        key: str,
+        key: str | None,
         b64decode: bool = True,
         decode: bool = False,
     ) -> list[BinaryVariable | str] | None:
@@ -366,12 +500,11 @@ class PlaybookRead:
         This method will deserialize the string, then iterate over the array and OPTIONALLY base64
         decode the data, and finally return the BinaryArray.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'BinaryArray')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'BinaryArray')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
@@ -382,39 +515,33 @@ class PlaybookRead:
         # 2. iterate over the array
         # 3. base64 decode the data
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode('utf-8')
-
         # deserialize the data
-        _data: list[str] = self._deserialize_data(data)
+        _data: list[BinaryVariable | str] = self._deserialize_data(data)
 
-        values = []
-        for d in _data:
-            if b64decode is True and isinstance(d, str):
-                d = BinaryVariable(base64.b64decode(d))
-                if decode is True:
-                    # allow developer to decided if they want bytes or str
-                    d = self._decode_binary(d)
-            values.append(d)
-        return values
+        if b64decode is not True:
+            return _data
+
+        _b64decode = base64.b64decode
+        if decode is True:
+            # allow developer to decided if they want bytes or str
+            decode_binary = self._decode_binary
+            return [decode_binary(_b64decode(d)) if isinstance(d, str) else d for d in _data]
+        return [BinaryVariable(_b64decode(d)) if isinstance(d, str) else d for d in _data]
 
     def key_value(
         self,
-        key: str,
+        key: str | None,
         resolve_embedded: bool = True,
     ) -> dict | None:
         """Read the value from key value store.
 
         KeyValue data should be stored as a JSON string.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'KeyValue')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'KeyValue')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
@@ -427,28 +554,22 @@ class PlaybookRead:
 
     def key_value_array(
         self,
-        key: str,
+        key: str | None,
         resolve_embedded: bool = True,
     ) -> list[dict] | None:
         """Read the value from key value store.
 
         KeyValueArray data should be stored as serialized string.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'KeyValueArray')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'KeyValueArray')
-
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         # Array type is serialized before writing to redis, deserialize the data
         _data: list[dict] = self._deserialize_data(data)
 
@@ -467,11 +588,15 @@ class PlaybookRead:
         if self._null_key_check(key) is True:
             return None
 
-        return self.key_value_store.client.read(self.context, key.strip())
+        key = key.strip()  # clean up key
+        if self._prefetched and key in self._prefetched:
+            return self._prefetched[key]
+
+        return self.key_value_store.client.read(self.context, key)
 
     def string(
         self,
-        key: str,
+        key: str | None,
         resolve_embedded: bool = True,
     ) -> Sensitive | str | None:
         """Read the value from key value store.
@@ -480,34 +605,32 @@ class PlaybookRead:
 
         This method will deserialize the string and finally return the StringArray data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'String')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'String')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         # deserialize the data
         data = self._deserialize_data(data)
 
         # only resolve embedded variables if resolve_embedded is True and
         # the entire string does not exactly match a variable pattern
-        if resolve_embedded and not self.util.is_playbook_variable(data):
+        if resolve_embedded and not _is_playbook_variable(data):
             data = self._read_embedded(data)
 
+        # the common case, the data is already a string
+        if isinstance(data, str):
+            return data
+
         # coerce data back to string, since technically TC doesn't support bool, int, etc
         return self._coerce_string_value(data)
 
-    def string_array(self, key: str) -> list[StringVariable] | None:
+    def string_array(self, key: str | None) -> list[StringVariable] | None:
         """Read the value from key value store.
 
         The string_array write method serializes the list of strings before writing to the key value
@@ -515,82 +638,67 @@ class PlaybookRead:
 
         This method will deserialize the list of strings and finally return the StringArray data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'StringArray')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'StringArray')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         # deserialize the data
         _data: list[str] = self._deserialize_data(data)
 
-        # return array of StringVariables
-        # return [StringVariable(self._coerce_string_value(d)) for d in _data]
-        return [d if d is None else StringVariable(self._coerce_string_value(d)) for d in _data]
+        # return array of StringVariables, str values are the common case and need no coercion
+        coerce = self._coerce_string_value
+        return [
+            d if d is None else StringVariable(d if isinstance(d, str) else coerce(d))
+            for d in _data
+        ]
 
-    def tc_batch(self, key: str) -> dict | None:
+    def tc_batch(self, key: str | None) -> dict | None:
         """Read the value from key value store.
 
         The tc_batch write method serializes the string before writing to the key value store.
 
         This method will deserialize the string and finally return the TCBatch data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'TCBatch')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'TCBatch')
-
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         return self._deserialize_data(data)
 
-    def tc_entity(self, key: str) -> dict[str, str] | None:
+    def tc_entity(self, key: str | None) -> dict[str, str] | None:
         """Read the value from key value store.
 
         The tc_entity write method serializes the dict before writing to the key value store.
 
         This method will deserialize the string and finally return the TCEntity data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'TCEntity')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'TCEntity')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         # deserialize the data
         return self._deserialize_data(data)
 
     def tc_entity_array(
         self,
-        key: str,
+        key: str | None,
     ) -> list[dict[str, str]] | None:
         """Read the value from key value store.
 
@@ -599,22 +707,16 @@ class PlaybookRead:
 
         This method will deserialize the list of dicts and finally return the TCEntityArray data.
         """
-        if self._null_key_check(key) is True:
+        # clean up the key and ensure an invalid key was not provided
+        key = self._prepare_key(key, 'TCEntityArray')
+        if key is None:
             return None
 
-        # quick check to ensure an invalid key was not provided
-        self._check_variable_type(key, 'TCEntityArray')
-
         # get the data from the key value store
         data = self._get_data(key)
         if data is None:
             return None
 
-        # data should be a serialized string, but in case there are any legacy Apps that are
-        # using an older version of TcEx, check for bytes and decode to string
-        if isinstance(data, bytes):
-            data = data.decode()
-
         # deserialize the data
         return self._deserialize_data(data)
 
@@ -631,7 +733,7 @@ class PlaybookRead:
         if value is not None and isinstance(key, str):
             key = key.strip()
 
-            if re.match(self.util.variable_playbook_match, key):
+            if _RE_VARIABLE_PLAYBOOK_MATCH.match(key):
                 value = self.any(key=key)
             else:
                 # replace space patterns